@@ -1,5 +1,6 @@
 from datetime import date
-from typing import List, Optional, Tuple, cast
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple, cast
 
 import regex as re
 from courts_db import courts
@@ -223,6 +224,17 @@ def extract_pin_cite(
     return None, None, None
 
 
+@lru_cache(maxsize=32)
+def _compile_anchored_regex(regex: str, forward: bool, flags: int) -> Pattern:
+    """Compile regex for match_on_tokens. Callers pass the same metadata
+    regexes over and over, so build and compile each variant only once."""
+    if forward:
+        # If scanning forward, regex must match at start
+        return cast(Pattern, re.compile(rf"^(?:{regex})", flags=flags))
+    # If scanning backward, regex must match at end
+    return cast(Pattern, re.compile(rf"(?:{regex})$", flags=flags))
+
+
 def match_on_tokens(
     words,
     start_index,
@@ -245,12 +257,8 @@ def match_on_tokens(
     # slice for performance to avoid copying list.
     if forward:
         indexes = range(min(start_index, len(words)), len(words))
-        # If scanning forward, regex must match at start
-        regex = rf"^(?:{regex})"
     else:
         indexes = range(max(start_index, -1), -1, -1)
-        # If scanning backward, regex must match at end
-        regex = rf"(?:{regex})$"
 
     # Append text of each token until we reach max_chars or a stop token:
     for index in indexes:
@@ -273,7 +281,7 @@ def match_on_tokens(
             text = text[:MAX_MATCH_CHARS]
             break
 
-    m = re.search(regex, text, flags=flags)
+    m = _compile_anchored_regex(regex, forward, flags).search(text)
     # Useful for debugging regex failures:
     # print(f"Regex: {regex}")
     # print(f"Text: {repr(text)}")
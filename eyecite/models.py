@@ -1,4 +1,5 @@
 import re
+import sys
 from collections import UserString
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -9,6 +10,7 @@ from typing import (
     Hashable,
     List,
     Optional,
+    Pattern,
     Sequence,
     Union,
     cast,
@@ -18,6 +20,10 @@ from eyecite.utils import HashableDict
 
 ResourceType = Hashable
 
+# Editions can't include cases from years that haven't happened yet.
+# Computed once at import, like helpers._highest_valid_year.
+_current_year = datetime.now().year
+
 
 @dataclass(eq=True, frozen=True)
 class Reporter:
@@ -30,10 +36,13 @@ class Reporter:
     is_scotus: bool = False
 
     def __post_init__(self):
+        # Intern strings that repeat across many reporters.
+        # use setattr because this class is frozen
+        object.__setattr__(self, "short_name", sys.intern(self.short_name))
+        object.__setattr__(self, "cite_type", sys.intern(self.cite_type))
         if (
             self.cite_type == "federal" and "supreme" in self.name.lower()
         ) or "scotus" in self.cite_type.lower():
-            # use setattr because this class is frozen
             object.__setattr__(self, "is_scotus", True)
 
 
@@ -46,6 +55,19 @@ class Edition:
     short_name: str
     start: Optional[datetime]
     end: Optional[datetime]
+    # Years of start and end, since includes_year() only compares years
+    start_year: Optional[int] = field(init=False, repr=False, compare=False)
+    end_year: Optional[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # use setattr because this class is frozen
+        object.__setattr__(self, "short_name", sys.intern(self.short_name))
+        object.__setattr__(
+            self, "start_year", self.start.year if self.start else None
+        )
+        object.__setattr__(
+            self, "end_year", self.end.year if self.end else None
+        )
 
     def includes_year(
         self,
@@ -53,9 +75,9 @@ class Edition:
     ) -> bool:
         """Return True if edition contains cases for the given year."""
         return (
-            year <= datetime.now().year
-            and (self.start is None or self.start.year <= year)
-            and (self.end is None or self.end.year >= year)
+            year <= _current_year
+            and (self.start_year is None or self.start_year <= year)
+            and (self.end_year is None or self.end_year >= year)
         )
 
 
@@ -85,12 +107,10 @@ class CitationBase:
     def __repr__(self):
         """Simplified repr() to be more readable than full dataclass repr().
         Just shows 'FullCaseCitation("matched text", groups=...)'."""
+        groups = f", groups={self.groups!r}" if self.groups else ""
         return (
-            f"{self.__class__.__name__}("
-            + f"{repr(self.matched_text())}"
-            + (f", groups={repr(self.groups)}" if self.groups else "")
-            + f", metadata={repr(self.metadata)}"
-            + ")"
+            f"{self.__class__.__name__}({self.matched_text()!r}{groups}, "
+            f"metadata={self.metadata!r})"
         )
 
     @dataclass(eq=True, unsafe_hash=True)
@@ -146,7 +166,6 @@ class ResourceCitation(CitationBase):
     # Editions that might match this reporter string
     exact_editions: Sequence[Edition] = field(default_factory=tuple)
     variation_editions: Sequence[Edition] = field(default_factory=tuple)
-    all_editions: Sequence[Edition] = field(default_factory=tuple)
     edition_guess: Optional[Edition] = None
 
     # year extracted from metadata["year"] and converted to int,
@@ -157,9 +176,6 @@ class ResourceCitation(CitationBase):
         """Make iterables into tuples to make sure we're hashable."""
         self.exact_editions = tuple(self.exact_editions)
         self.variation_editions = tuple(self.variation_editions)
-        self.all_editions = tuple(self.exact_editions) + tuple(
-            self.variation_editions
-        )
         super().__post_init__()
 
     @dataclass(eq=True, unsafe_hash=True)
@@ -169,6 +185,13 @@ class ResourceCitation(CitationBase):
         pin_cite: Optional[str] = None
         year: Optional[str] = None
 
+    @property
+    def all_editions(self) -> tuple:
+        """Exact editions followed by variation editions."""
+        return cast(tuple, self.exact_editions) + cast(
+            tuple, self.variation_editions
+        )
+
     def comparison_hash(self) -> int:
         """Return hash that will be the same if two cites are semantically
         equivalent."""
@@ -252,7 +275,7 @@ class FullLawCitation(FullCitation):
             i for i in (m.publisher, m.month, m.day, m.year) if i
         )
         if publisher_date:
-            parts.append(f" ({publisher_date}")
+            parts.append(f" ({publisher_date})")
         if m.parenthetical:
             parts.append(f" ({m.parenthetical})")
         return "".join(parts)
@@ -345,9 +368,9 @@ class FullCaseCitation(CaseCitation, FullCitation):
             parts.append(f", {m.pin_cite}")
         if m.extra:
             parts.append(m.extra)
-        publisher_date = " ".join(m[i] for i in (m.court, m.year) if i)
+        publisher_date = " ".join(i for i in (m.court, m.year) if i)
         if publisher_date:
-            parts.append(f" ({publisher_date}")
+            parts.append(f" ({publisher_date})")
         if m.parenthetical:
             parts.append(f" ({m.parenthetical})")
         return "".join(parts)
@@ -454,7 +477,8 @@ class NonopinionCitation(CitationBase):
 @dataclass(eq=True, unsafe_hash=True)
 class Token(UserString):
     """Base class for special tokens. For performance, this isn't used
-    for generic words."""
+    for generic words. This wraps a string rather than subclassing str,
+    so that isinstance(token, str) is only True for those generic words."""
 
     data: str
     start: int
@@ -547,6 +571,14 @@ class ParagraphToken(Token):
 class StopWordToken(Token):
     """Word matching one of the STOP_TOKENS."""
 
+    @classmethod
+    def from_match(cls, m, extra, offset=0) -> "Token":
+        """Lowercase the stop word group, since it is matched
+        case-insensitively but checked against lowercase strings."""
+        token = super().from_match(m, extra, offset)
+        token.groups["stop_word"] = token.groups["stop_word"].lower()
+        return token
+
 
 @dataclass
 class TokenExtractor:
@@ -561,6 +593,12 @@ class TokenExtractor:
     extra: Dict = field(default_factory=dict)
     flags: int = 0
     strings: List = field(default_factory=list)
+    # Compiled on first use rather than in __post_init__, because most of
+    # the thousands of extractors are never run by the filtering tokenizers
+    # and compiling all of them up front would slow down import.
+    _compiled_regex: Optional[Pattern] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_matches(self, text):
         """Return match objects for all matches in text."""
@@ -572,13 +610,15 @@ class TokenExtractor:
 
     def __hash__(self):
         """This needs to be hashable so we can remove redundant
-        extractors returned by the pyahocorasick filter."""
-        return hash(repr(self))
+        extractors returned by the pyahocorasick filter. Equal extractors
+        always share regex and flags, and hashing those is much cheaper
+        than hashing repr(self), which formats every edition in extra."""
+        return hash((self.regex, self.flags))
 
     @property
-    def compiled_regex(self):
+    def compiled_regex(self) -> Pattern:
         """Cache compiled regex as a property."""
-        if not hasattr(self, "_compiled_regex"):
+        if self._compiled_regex is None:
             self._compiled_regex = re.compile(self.regex, flags=self.flags)
         return self._compiled_regex
 
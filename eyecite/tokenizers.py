@@ -3,10 +3,12 @@ import re
 from collections import defaultdict
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from string import Template
 from typing import (
     Any,
+    Dict,
     Generator,
     Iterable,
     List,
@@ -65,9 +67,13 @@ def _populate_reporter_extractors():
     raw_regex_variables["page"][""] = rf"(?P<page>{PAGE_NUMBER_REGEX})"
     regex_variables = process_variables(raw_regex_variables)
 
+    # The same edition names are escaped for every regex template and again
+    # when checking for strings, so only escape each one once:
+    escape = lru_cache(maxsize=None)(re.escape)
+
     def _substitute_edition(template, *edition_names):
         """Helper to replace $edition in template with edition_names."""
-        edition = "|".join(re.escape(e) for e in edition_names)
+        edition = "|".join(escape(e) for e in edition_names)
         return Template(template).safe_substitute(edition=edition)
 
     # Extractors step one: add an extractor for each reporter string
@@ -107,7 +113,7 @@ def _populate_reporter_extractors():
         editions_by_regex[regex][kind].append(edition)
 
         # add strings
-        have_strings = re.escape(reporters[0]) in regex
+        have_strings = escape(reporters[0]) in regex
         if have_strings:
             editions_by_regex[regex]["strings"].update(reporters)
 
@@ -334,6 +340,12 @@ class Tokenizer:
 
     def extract_tokens(self, text) -> Generator[Token, None, None]:
         """Get all instances where an extractor matches the given text."""
+        # Each extractor scans the text separately. Joining the regexes into
+        # a single "(?P<e0>...)|(?P<e1>...)" alternation would return at most
+        # one match per position, but tokenize() needs overlapping matches
+        # from different extractors -- e.g. the same cite matched by an
+        # exact and a variation regex, so their editions can be merged.
+        # HyperscanTokenizer provides a true single-pass scan.
         for extractor in self.get_extractors(text):
             for match in extractor.get_matches(text):
                 yield extractor.get_token(match)
@@ -414,6 +426,45 @@ class AhocorasickTokenizer(Tokenizer):
         return text_filter
 
 
+@dataclass
+class Re2Tokenizer(AhocorasickTokenizer):
+    """A Tokenizer that filters extractors like AhocorasickTokenizer,
+    but runs them with the google-re2 library, which guarantees
+    linear-time matching. Extractors that re2 can't compile fall back
+    to the builtin re library."""
+
+    def __post_init__(self):
+        """Set up cache of compiled re2 regexes."""
+        super().__post_init__()
+        self._re2_regexes: Dict[TokenExtractor, Any] = {}
+
+    def extract_tokens(self, text) -> Generator[Token, None, None]:
+        """Extract tokens via re2."""
+        for extractor in self.get_extractors(text):
+            regex = self.get_re2_regex(extractor)
+            for match in regex.finditer(text):
+                yield extractor.get_token(match)
+
+    def get_re2_regex(self, extractor: TokenExtractor):
+        """Compile extractor's regex with re2, or return the builtin
+        compiled regex if re2 doesn't support it."""
+        if extractor not in self._re2_regexes:
+            # import here so the dependency is optional
+            import re2  # pylint: disable=import-outside-toplevel
+
+            options = re2.Options()
+            options.case_sensitive = not extractor.flags & re.I
+            # re2 treats repetition flags like {,3} as literal text,
+            # so replace with {0,3}:
+            regex = re.sub(r"\{,(\d+)\}", r"{0,\1}", extractor.regex)
+            try:
+                compiled_regex = re2.compile(regex, options)
+            except re2.error:
+                compiled_regex = extractor.compiled_regex
+            self._re2_regexes[extractor] = compiled_regex
+        return self._re2_regexes[extractor]
+
+
 @dataclass
 class HyperscanTokenizer(Tokenizer):
     """A performance-optimized Tokenizer using the
@@ -21,6 +21,7 @@ from eyecite.tokenizers import (
     EXTRACTORS,
     AhocorasickTokenizer,
     HyperscanTokenizer,
+    Re2Tokenizer,
     Tokenizer,
 )
 
@@ -29,6 +30,7 @@ tested_tokenizers = [
     Tokenizer(),
     AhocorasickTokenizer(),
     HyperscanTokenizer(cache_dir=cache_dir),
+    Re2Tokenizer(),
 ]
 
 
@@ -95,6 +97,10 @@ class FindTest(TestCase):
             ('lissner v. test 1 U.S. 1',
              [case_citation(metadata={'plaintiff': 'lissner',
                                       'defendant': 'test'})]),
+            # Test with capitalized stop word
+            ('lissner V. test 1 U.S. 1',
+             [case_citation(metadata={'plaintiff': 'lissner',
+                                      'defendant': 'test'})]),
             # Test with plaintiff, defendant and year
             ('lissner v. test 1 U.S. 1 (1982)',
              [case_citation(metadata={'plaintiff': 'lissner',
@@ -692,8 +698,7 @@ class FindTest(TestCase):
         for e in EXTRACTORS:
             e = copy(e)
             e.regex = e.regex.replace(r"\.", r"[.,]")
-            if hasattr(e, "_compiled_regex"):
-                del e._compiled_regex
+            e._compiled_regex = None
             extractors.append(e)
         tokenizer = Tokenizer(extractors)
 
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from eyecite import get_citations
 from eyecite.test_factories import case_citation
 
 
@@ -15,3 +16,20 @@ class ModelsTest(TestCase):
         self.assertEqual(citations[0], citations[1])
         self.assertEqual(hash(citations[0]), hash(citations[1]))
         print("✓")
+
+    def test_corrected_full_citation_includes_metadata(self):
+        """Does corrected_citation_full() format the extracted metadata?"""
+        test_pairs = [
+            (
+                "Foo v. Bar, 1 U.S. 1, 4 (1999) (overruling foo)",
+                "Foo v. Bar, 1 U.S. 1, 4 (scotus 1999) (overruling foo)",
+            ),
+            (
+                "Mass. Gen. Laws ch. 1, § 2 (West 1999)",
+                "Mass. Gen. Laws ch. 1, § 2 (West 1999)",
+            ),
+        ]
+        for text, expected in test_pairs:
+            with self.subTest(text=text):
+                citation = get_citations(text)[0]
+                self.assertEqual(citation.corrected_citation_full(), expected)